@@ -1,5 +1,6 @@
 from columns.models import Article, Column
 from core.views import SetHeadlineMixin
+from django.db.models import Prefetch
 from hitcount.views import HitCountDetailView
 
 
@@ -14,12 +15,24 @@ class ColumnDetailView(SetHeadlineMixin, HitCountDetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        articles = self.object.article_set.visible().order_by("-publish_date")
-        context["articles"] = articles
+        context["articles"] = self.object.visible_articles
         return context
 
     def get_queryset(self):
-        return Column.objects.visible().order_by("-created_at")
+        return (
+            Column.objects.visible()
+            .order_by("-created_at")
+            .prefetch_related(
+                Prefetch(
+                    "article_set",
+                    queryset=Article.objects.visible()
+                    .select_related("column")
+                    .order_by("-publish_date")
+                    .with_comment_count(),
+                    to_attr="visible_articles",
+                )
+            )
+        )
 
     def get_headline(self):
         return self.object.title